@@ -6,7 +6,7 @@ This tool parses HTML presentation decks created with the Amplifier Stories styl
 and generates equivalent PowerPoint presentations using python-pptx.
 
 Usage:
-    uv run --with python-pptx,beautifulsoup4,lxml python tools/html2pptx.py <input.html> [output.pptx]
+    uv run --with "python-pptx>=1.0,<2" --with beautifulsoup4,lxml python tools/html2pptx.py <input.html> [output.pptx]
 
 If output path is not specified, uses the input filename with .pptx extension.
 
@@ -25,14 +25,16 @@ The tool extracts:
 import argparse
 import re
 import sys
+from copy import deepcopy
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
 from pptx import Presentation
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.util import Inches, Pt
 
 # Color palette (matching Amplifier Stories style)
@@ -48,31 +50,163 @@ GRAY_50 = RGBColor(0x80, 0x80, 0x80)
 DARK_GRAY = RGBColor(0x1A, 0x1A, 0x1A)
 BORDER_GRAY = RGBColor(0x33, 0x33, 0x33)
 
+EMU_PER_INCH = 914400
+BORDER_WIDTH = Pt(1)
+
+# a:defRPr sz values (hundredths of a point) for the font sizes slides use
+_FONT_SZ = {size: str(Pt(size).centipoints) for size in range(8, 73)}
+
+
+def inches_to_emu(inches: float) -> int:
+    """Convert inches to EMU; same result as Inches() without the Length object."""
+    return int(inches * EMU_PER_INCH)
+
+
+# Accent color for each CSS class that carries one
+_CLASS_COLOR_MAP = {
+    "green": MS_GREEN,
+    "orange": MS_ORANGE,
+    "red": MS_RED,
+    "ms-green": MS_GREEN,
+    "ms-orange": MS_ORANGE,
+    "ms-red": MS_RED,
+    "ms-blue": MS_BLUE,
+    "ms-cyan": MS_CYAN,
+    "warning": MS_ORANGE,
+}
+
+# Tinted backgrounds for tenet and highlight boxes
+_TENET_BG_GREEN = RGBColor(0x0D, 0x1A, 0x0D)
+_TENET_BG_ORANGE = RGBColor(0x1A, 0x15, 0x0D)
+_TENET_BG_RED = RGBColor(0x1A, 0x0D, 0x0D)
+_TENET_BG_BLUE = RGBColor(0x0D, 0x15, 0x1A)
+_HIGHLIGHT_BG_GREEN = RGBColor(0x00, 0x1A, 0x0D)
+_HIGHLIGHT_BG_ORANGE = RGBColor(0x33, 0x1A, 0x00)
+_HIGHLIGHT_BG_BLUE = RGBColor(0x00, 0x1A, 0x33)
+
+# Background for each accent color
+_TENET_BG_MAP = {
+    MS_GREEN: _TENET_BG_GREEN,
+    MS_ORANGE: _TENET_BG_ORANGE,
+    MS_RED: _TENET_BG_RED,
+}
+_DEFAULT_TENET_BG = _TENET_BG_BLUE
+
+_HIGHLIGHT_BG_MAP = {
+    MS_GREEN: _HIGHLIGHT_BG_GREEN,
+    MS_ORANGE: _HIGHLIGHT_BG_ORANGE,
+}
+_DEFAULT_HIGHLIGHT_BG = _HIGHLIGHT_BG_BLUE
+
 
 def parse_color_from_class(classes: list[str]) -> Optional[RGBColor]:
     """Extract accent color from CSS classes."""
-    color_map = {
-        "green": MS_GREEN,
-        "orange": MS_ORANGE,
-        "red": MS_RED,
-        "ms-green": MS_GREEN,
-        "ms-orange": MS_ORANGE,
-        "ms-red": MS_RED,
-        "ms-blue": MS_BLUE,
-        "ms-cyan": MS_CYAN,
-        "warning": MS_ORANGE,
-    }
     for cls in classes:
-        if cls in color_map:
-            return color_map[cls]
+        if cls in _CLASS_COLOR_MAP:
+            return _CLASS_COLOR_MAP[cls]
     return None
 
 
+# Containers that lay out their .card children as a single row
+CARD_CONTAINER_CLASSES = frozenset({"thirds", "halves", "fourths"})
+
+# Matches a raw class attribute containing the "slide" token. SoupStrainer sees
+# the unsplit attribute string while parsing, so class_="slide" alone would
+# miss <div class="slide center">.
+_SLIDE_CLASS_RE = re.compile(r"(?:^|\s)slide(?:\s|$)")
+
+# String types that carry visible text (excludes comments, scripts, styles)
+_TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Runs of HTML (ASCII) whitespace, collapsed to one space like a browser renders
+# them. \s would also fold &nbsp; and other Unicode spaces, which browsers keep.
+_WHITESPACE_RE = re.compile(r"[ \t\n\r\f]+")
+
+
 def get_text(element: Optional[Tag]) -> str:
-    """Extract text content from an element, handling None."""
+    """Extract text content from an element, handling None.
+
+    Whitespace is collapsed as in HTML and <br> tags become newlines.
+    """
     if element is None:
         return ""
-    return element.get_text(strip=True)
+    lines = []
+    parts = []
+    for node in element.descendants:
+        if type(node) in _TEXT_STRING_TYPES:
+            parts.append(node)
+        elif node.name == "br":
+            lines.append(_WHITESPACE_RE.sub(" ", "".join(parts)).strip())
+            parts = []
+    lines.append(_WHITESPACE_RE.sub(" ", "".join(parts)).strip())
+    return "\n".join(lines).strip()
+
+
+def index_classes(root: Tag) -> dict[str, list[Tag]]:
+    """Map each CSS class to the tags under root carrying it, in document order.
+
+    One descendant walk replaces a find()/find_all() scan per class.
+    """
+    index: dict[str, list[Tag]] = {}
+    for node in root.descendants:
+        if isinstance(node, Tag):
+            for cls in node.get("class", ()):
+                index.setdefault(cls, []).append(node)
+    return index
+
+
+def find_indexed(index: dict[str, list[Tag]], cls: str) -> Optional[Tag]:
+    """Return the first tag with the given class from a class index."""
+    tags = index.get(cls)
+    return tags[0] if tags else None
+
+
+def find_all_indexed(root: Tag, index: dict[str, list[Tag]], classes: Iterable[str]) -> list[Tag]:
+    """Return tags under root having any of the given classes, in document order."""
+    present = [cls for cls in classes if cls in index]
+    if not present:
+        return []
+    if len(present) == 1:
+        return index[present[0]]
+    # Buckets for different classes interleave; let bs4 merge them in order
+    return root.find_all(class_=classes)
+
+
+def find_first_by_class(root: Tag, classes: Iterable[str]) -> dict[str, Optional[Tag]]:
+    """Return the first tag under root for each class, like find(class_=...) per class.
+
+    Fills every slot in one descendant walk and stops once all are found.
+    """
+    found: dict[str, Optional[Tag]] = dict.fromkeys(classes)
+    missing = len(found)
+    for node in root.descendants:
+        if isinstance(node, Tag):
+            for cls in node.get("class", ()):
+                if cls in found and found[cls] is None:
+                    found[cls] = node
+                    missing -= 1
+                    if not missing:
+                        return found
+    return found
+
+
+def subtree_classes(root: Tag) -> set[str]:
+    """Return the class tokens carried by root and any tag beneath it."""
+    classes = set(root.get("class", ()))
+    for node in root.descendants:
+        if isinstance(node, Tag):
+            classes.update(node.get("class", ()))
+    return classes
+
+
+def tag_ids(index: dict[str, list[Tag]], classes: Iterable[str]) -> set[int]:
+    """Return the identities of indexed tags having any of the given classes."""
+    return {id(tag) for cls in classes for tag in index.get(cls, ())}
+
+
+def has_ancestor_in(tag: Tag, ids: set[int]) -> bool:
+    """Check whether any ancestor of tag is one of the given tag identities."""
+    return bool(ids) and any(id(parent) in ids for parent in tag.parents)
 
 
 def set_slide_background(slide, color=BLACK):
@@ -83,6 +217,22 @@ def set_slide_background(slide, color=BLACK):
     fill.fore_color.rgb = color
 
 
+# Shapes are cloned from prebuilt <p:sp> templates, producing the same XML as
+# add_textbox()/add_shape() plus their property setters in one step.
+
+# Text box <p:sp> cloned by add_text_box; attribute values are placeholders
+_TEXTBOX_SP = parse_xml(
+    f"<p:sp {nsdecls('a', 'p')}>"
+    '<p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p><a:pPr algn="l"><a:defRPr sz="0" b="0" i="0">'
+    '<a:solidFill><a:srgbClr val="000000"/></a:solidFill>'
+    "</a:defRPr></a:pPr></a:p></p:txBody></p:sp>"
+)
+
+
 def add_text_box(
     slide,
     text: str,
@@ -98,17 +248,89 @@ def add_text_box(
     wrap: bool = True,
 ):
     """Add a text box with specified styling."""
-    box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
-    tf = box.text_frame
-    tf.word_wrap = wrap
-    p = tf.paragraphs[0]
-    p.text = text
-    p.font.size = Pt(font_size)
-    p.font.bold = bold
-    p.font.italic = italic
-    p.font.color.rgb = color
-    p.alignment = align
-    return box
+    # Relies on private ShapeTree internals (_next_shape_id, _spTree,
+    # _shape_factory), checked against python-pptx 1.0.2; the usage line pins <2.
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    sp = deepcopy(_TEXTBOX_SP)
+    nv_sp_pr, sp_pr, tx_body = sp
+    body_pr, _, paragraph = tx_body
+    p_pr = paragraph[0]
+    def_r_pr = p_pr[0]
+    off, ext = sp_pr[0]
+
+    c_nv_pr = nv_sp_pr[0]
+    c_nv_pr.set("id", str(shape_id))
+    c_nv_pr.set("name", f"TextBox {shape_id - 1}")
+    off.set("x", str(inches_to_emu(left)))
+    off.set("y", str(inches_to_emu(top)))
+    ext.set("cx", str(inches_to_emu(width)))
+    ext.set("cy", str(inches_to_emu(height)))
+    body_pr.set("wrap", "square" if wrap else "none")
+    p_pr.set("algn", align.xml_value)
+    def_r_pr.set("sz", _FONT_SZ.get(font_size) or str(Pt(font_size).centipoints))
+    def_r_pr.set("b", "1" if bold else "0")
+    def_r_pr.set("i", "1" if italic else "0")
+    def_r_pr[0][0].set("val", str(color))
+    paragraph.append_text(text)
+
+    shapes._spTree.insert_element_before(sp, "p:extLst")
+    return shapes._shape_factory(sp)
+
+
+# Autoshape <p:sp> cloned by add_filled_box, with a 1pt outline or no line
+_FILLED_SP_XML = (
+    "<p:sp %s>"
+    '<p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="000000"/></a:solidFill>%s</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+    "</p:sp>"
+)
+_BORDERED_SP = parse_xml(
+    _FILLED_SP_XML
+    % (nsdecls("a", "p"), f'<a:ln w="{BORDER_WIDTH}"><a:solidFill><a:srgbClr val="000000"/></a:solidFill></a:ln>')
+)
+_BORDERLESS_SP = parse_xml(_FILLED_SP_XML % (nsdecls("a", "p"), "<a:ln><a:noFill/></a:ln>"))
+
+
+def add_filled_box(
+    slide,
+    left: float,
+    top: float,
+    width: float,
+    height: float,
+    fill: RGBColor,
+    border: Optional[RGBColor] = None,
+    rounded: bool = False,
+):
+    """Add a solid-filled rectangle, outlined at 1pt if border is set."""
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    sp = deepcopy(_BORDERLESS_SP if border is None else _BORDERED_SP)
+    nv_sp_pr, sp_pr = sp[0], sp[1]
+    xfrm, prst_geom, solid_fill, line = sp_pr
+    off, ext = xfrm
+
+    c_nv_pr = nv_sp_pr[0]
+    c_nv_pr.set("id", str(shape_id))
+    c_nv_pr.set("name", f"{'Rounded Rectangle' if rounded else 'Rectangle'} {shape_id - 1}")
+    off.set("x", str(inches_to_emu(left)))
+    off.set("y", str(inches_to_emu(top)))
+    ext.set("cx", str(inches_to_emu(width)))
+    ext.set("cy", str(inches_to_emu(height)))
+    prst_geom.set("prst", "roundRect" if rounded else "rect")
+    solid_fill[0].set("val", str(fill))
+    if border is not None:
+        line[0][0].set("val", str(border))
+
+    shapes._spTree.insert_element_before(sp, "p:extLst")
+    return shapes._shape_factory(sp)
 
 
 def add_section_label(slide, text: str, top: float = 0.6):
@@ -172,13 +394,7 @@ def add_card(
 ):
     """Add a card with title and description."""
     # Card background
-    card = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height)
-    )
-    card.fill.solid()
-    card.fill.fore_color.rgb = DARK_GRAY
-    card.line.color.rgb = BORDER_GRAY
-    card.line.width = Pt(1)
+    add_filled_box(slide, left, top, width, height, DARK_GRAY, border=BORDER_GRAY, rounded=True)
 
     # Card title
     add_text_box(
@@ -218,28 +434,13 @@ def add_tenet(
 ):
     """Add a tenet box with left border accent."""
     # Background color based on accent
-    if accent_color == MS_GREEN:
-        bg_color = RGBColor(0x0D, 0x1A, 0x0D)
-    elif accent_color == MS_ORANGE:
-        bg_color = RGBColor(0x1A, 0x15, 0x0D)
-    elif accent_color == MS_RED:
-        bg_color = RGBColor(0x1A, 0x0D, 0x0D)
-    else:
-        bg_color = RGBColor(0x0D, 0x15, 0x1A)
+    bg_color = _TENET_BG_MAP.get(accent_color, _DEFAULT_TENET_BG)
 
     # Background
-    box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
-    box.fill.solid()
-    box.fill.fore_color.rgb = bg_color
-    box.line.fill.background()
+    add_filled_box(slide, left, top, width, height, bg_color)
 
     # Left accent bar
-    accent = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(0.05), Inches(height)
-    )
-    accent.fill.solid()
-    accent.fill.fore_color.rgb = accent_color
-    accent.line.fill.background()
+    add_filled_box(slide, left, top, 0.05, height, accent_color)
 
     # Title
     add_text_box(
@@ -269,18 +470,9 @@ def add_tenet(
 
 def add_highlight_box(slide, text: str, top: float = 4.2, color: RGBColor = MS_BLUE):
     """Add a highlight/callout box."""
-    if color == MS_GREEN:
-        bg_color = RGBColor(0x00, 0x1A, 0x0D)
-    elif color == MS_ORANGE:
-        bg_color = RGBColor(0x33, 0x1A, 0x00)
-    else:
-        bg_color = RGBColor(0x00, 0x1A, 0x33)
+    bg_color = _HIGHLIGHT_BG_MAP.get(color, _DEFAULT_HIGHLIGHT_BG)
 
-    box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.8), Inches(top), Inches(8.4), Inches(0.7))
-    box.fill.solid()
-    box.fill.fore_color.rgb = bg_color
-    box.line.color.rgb = color
-    box.line.width = Pt(1)
+    add_filled_box(slide, 0.8, top, 8.4, 0.7, bg_color, border=color, rounded=True)
 
     add_text_box(
         slide,
@@ -298,7 +490,8 @@ class HTMLToPPTXConverter:
     """Converts Amplifier Stories HTML decks to PowerPoint."""
 
     def __init__(self, html_content: str):
-        self.soup = BeautifulSoup(html_content, "lxml")
+        # Only slide subtrees are ever read, so skip building the rest of the page
+        self.soup = BeautifulSoup(html_content, "lxml", parse_only=SoupStrainer("div", class_=_SLIDE_CLASS_RE))
         self.prs = Presentation()
         self.prs.slide_width = Inches(10)
         self.prs.slide_height = Inches(5.625)
@@ -316,13 +509,17 @@ class HTMLToPPTXConverter:
     def process_slide(self, slide_div: Tag, slide_num: int):
         """Process a single slide div and add to presentation."""
         slide = self.prs.slides.add_slide(self.blank_layout)
+        # Cache the last shape id instead of searching every shape id on each add.
+        # Safe because this Slide object is the only one touching the slide.
+        slide.shapes.turbo_add_enabled = True
         set_slide_background(slide)
 
         is_centered = self.is_centered(slide_div)
         current_top = 0.6
+        index = index_classes(slide_div)
 
         # Extract section label
-        section_label = slide_div.find(class_="section-label")
+        section_label = find_indexed(index, "section-label")
         if section_label:
             if is_centered:
                 current_top = 1.5
@@ -330,9 +527,11 @@ class HTMLToPPTXConverter:
             current_top += 0.5
 
         # Extract headline (h1 or .headline)
-        headline = slide_div.find(["h1", "h2"], class_="headline") or slide_div.find("h1")
+        headline = next(
+            (el for el in index.get("headline", ()) if el.name in ("h1", "h2")), None
+        ) or slide_div.find("h1")
         if headline:
-            text = get_text(headline).replace("<br>", "\n")
+            text = get_text(headline)
             # Check for gradient/big text styling
             has_gradient = "big-text" in headline.get("class", [])
             color = MS_CYAN if has_gradient else WHITE
@@ -345,20 +544,20 @@ class HTMLToPPTXConverter:
             current_top += 1.2 if size > 45 else 0.9
 
         # Extract medium headline (h2.medium-headline)
-        medium_headline = slide_div.find(class_="medium-headline")
+        medium_headline = find_indexed(index, "medium-headline")
         if medium_headline and medium_headline != headline:
             add_headline(slide, get_text(medium_headline), top=current_top, size=36, center=is_centered)
             current_top += 0.8
 
         # Extract subhead
-        subhead = slide_div.find(class_="subhead") or slide_div.find("p", class_="subhead")
+        subhead = find_indexed(index, "subhead")
         if subhead:
             text = get_text(subhead)
             add_subhead(slide, text, top=current_top, center=is_centered)
             current_top += 0.8
 
         # Extract cards (.card elements in .thirds or .halves or .fourths)
-        card_containers = slide_div.find_all(class_=["thirds", "halves", "fourths"])
+        card_containers = find_all_indexed(slide_div, index, CARD_CONTAINER_CLASSES)
         for container in card_containers:
             cards = container.find_all(class_="card")
             if cards:
@@ -366,40 +565,40 @@ class HTMLToPPTXConverter:
                 current_top += 2.0
 
         # Extract standalone cards not in containers
-        standalone_cards = [
-            c for c in slide_div.find_all(class_="card") if not c.find_parent(class_=["thirds", "halves", "fourths"])
-        ]
+        container_ids = tag_ids(index, CARD_CONTAINER_CLASSES)
+        standalone_cards = [c for c in index.get("card", []) if not has_ancestor_in(c, container_ids)]
         if standalone_cards:
             self._add_cards(slide, standalone_cards, current_top)
             current_top += 2.0
 
         # Extract tenet boxes
-        tenets = slide_div.find_all(class_="tenet")
+        tenets = index.get("tenet", [])
         if tenets:
             self._add_tenets(slide, tenets, current_top)
             current_top += len(tenets) * 0.5 + 0.5
 
         # Extract versus comparison
-        versus = slide_div.find(class_="versus")
+        versus = find_indexed(index, "versus")
         if versus:
             self._add_versus(slide, versus, current_top)
             current_top += 2.5
 
         # Extract tables
-        tables = slide_div.find_all("table", class_="data-table")
+        tables = [t for t in index.get("data-table", []) if t.name == "table"]
         for table in tables:
             self._add_table(slide, table, current_top)
             current_top += 2.5
 
         # Extract feature lists
-        feature_lists = slide_div.find_all(class_="feature-list")
+        feature_lists = index.get("feature-list", [])
+        versus_ids = tag_ids(index, ("versus",))
         for fl in feature_lists:
-            if not fl.find_parent(class_="versus"):  # Skip lists inside versus
+            if not has_ancestor_in(fl, versus_ids):  # Skip lists inside versus
                 self._add_feature_list(slide, fl, current_top)
                 current_top += 1.5
 
         # Extract highlight boxes
-        highlight_boxes = slide_div.find_all(class_="highlight-box")
+        highlight_boxes = index.get("highlight-box", [])
         for hb in highlight_boxes:
             classes = hb.get("class", [])
             color = parse_color_from_class(classes) or MS_BLUE
@@ -408,17 +607,17 @@ class HTMLToPPTXConverter:
             current_top += 0.8
 
         # Extract stats grid
-        stat_grid = slide_div.find(class_="stat-grid")
+        stat_grid = find_indexed(index, "stat-grid")
         if stat_grid:
             self._add_stats(slide, stat_grid, current_top)
 
         # Extract quote
-        quote = slide_div.find(class_="quote")
+        quote = find_indexed(index, "quote")
         if quote:
             self._add_quote(slide, quote, current_top)
 
         # Extract small text at bottom
-        small_text = slide_div.find(class_="small-text")
+        small_text = find_indexed(index, "small-text")
         if small_text:
             add_text_box(
                 slide,
@@ -451,9 +650,10 @@ class HTMLToPPTXConverter:
             start_left = 0.8
 
         for i, card in enumerate(cards):
-            title_el = card.find(class_="card-title")
-            text_el = card.find(class_="card-text")
-            number_el = card.find(class_="card-number")
+            parts = find_first_by_class(card, ("card-title", "card-text", "card-number"))
+            title_el = parts["card-title"]
+            text_el = parts["card-text"]
+            number_el = parts["card-number"]
 
             title = get_text(title_el) if title_el else ""
             text = get_text(text_el) if text_el else ""
@@ -472,13 +672,7 @@ class HTMLToPPTXConverter:
     ):
         """Add a card with a big number."""
         # Card background
-        card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(1.8)
-        )
-        card.fill.solid()
-        card.fill.fore_color.rgb = DARK_GRAY
-        card.line.color.rgb = BORDER_GRAY
-        card.line.width = Pt(1)
+        add_filled_box(slide, left, top, width, 1.8, DARK_GRAY, border=BORDER_GRAY, rounded=True)
 
         # Big number
         add_text_box(
@@ -528,8 +722,7 @@ class HTMLToPPTXConverter:
         # Determine layout: 2 columns if 4+ tenets
         if num_tenets >= 4:
             for i, tenet in enumerate(tenets):
-                col = i % 2
-                row = i // 2
+                row, col = divmod(i, 2)
                 self._add_single_tenet(slide, tenet, 0.8 + col * 4.5, top + row * 1.0, width=4.2)
         else:
             for i, tenet in enumerate(tenets):
@@ -537,8 +730,9 @@ class HTMLToPPTXConverter:
 
     def _add_single_tenet(self, slide, tenet: Tag, left: float, top: float, width: float):
         """Add a single tenet box."""
-        title_el = tenet.find(class_="tenet-title")
-        text_el = tenet.find(class_="tenet-text")
+        parts = find_first_by_class(tenet, ("tenet-title", "tenet-text"))
+        title_el = parts["tenet-title"]
+        text_el = parts["tenet-text"]
 
         title = get_text(title_el) if title_el else ""
         text = get_text(text_el) if text_el else ""
@@ -554,63 +748,41 @@ class HTMLToPPTXConverter:
         if len(sides) < 2:
             return
 
-        left_side = sides[0]
-        right_side = sides[1]
-
-        # Left title
-        left_title = left_side.find(class_="versus-title")
-        if left_title:
-            classes = left_title.get("class", [])
-            color = parse_color_from_class(classes) or MS_ORANGE
-            add_text_box(
-                slide, get_text(left_title), left=0.8, top=top, width=4.0, height=0.4, font_size=24, bold=True, color=color
-            )
-
-        # Left items
-        left_list = left_side.find(class_="feature-list")
-        if left_list:
-            items = left_list.find_all("li")
-            for i, item in enumerate(items):
-                text = get_text(item)
-                # Check for check/x marks
-                if "✓" in text or "check" in str(item):
-                    color = MS_GREEN
-                elif "✗" in text or "x-mark" in str(item):
-                    color = MS_RED
-                else:
-                    color = WHITE
-                add_text_box(
-                    slide, text, left=0.8, top=top + 0.5 + i * 0.35, width=4.0, height=0.35, font_size=14, color=color
-                )
+        self._add_versus_side(slide, sides[0], left=0.8, top=top, title_color=MS_ORANGE)
 
         # VS divider
         add_text_box(
             slide, "vs", left=4.5, top=top + 1.2, width=1.0, height=0.5, font_size=32, bold=True, color=GRAY_50, align=PP_ALIGN.CENTER
         )
 
-        # Right title
-        right_title = right_side.find(class_="versus-title")
-        if right_title:
-            classes = right_title.get("class", [])
-            color = parse_color_from_class(classes) or MS_GREEN
+        self._add_versus_side(slide, sides[1], left=5.5, top=top, title_color=MS_GREEN)
+
+    def _add_versus_side(self, slide, side: Tag, left: float, top: float, title_color: RGBColor):
+        """Add one side of a versus comparison: its title and feature items."""
+        parts = find_first_by_class(side, ("versus-title", "feature-list"))
+        title = parts["versus-title"]
+        if title:
+            classes = title.get("class", [])
+            color = parse_color_from_class(classes) or title_color
             add_text_box(
-                slide, get_text(right_title), left=5.5, top=top, width=4.0, height=0.4, font_size=24, bold=True, color=color
+                slide, get_text(title), left=left, top=top, width=4.0, height=0.4, font_size=24, bold=True, color=color
             )
 
-        # Right items
-        right_list = right_side.find(class_="feature-list")
-        if right_list:
-            items = right_list.find_all("li")
+        feature_list = parts["feature-list"]
+        if feature_list:
+            items = feature_list.find_all("li")
             for i, item in enumerate(items):
                 text = get_text(item)
-                if "✓" in text or "check" in str(item):
+                # Check for check/x marks
+                marks = subtree_classes(item)
+                if "✓" in text or "check" in marks:
                     color = MS_GREEN
-                elif "✗" in text or "x-mark" in str(item):
+                elif "✗" in text or "x-mark" in marks:
                     color = MS_RED
                 else:
                     color = WHITE
                 add_text_box(
-                    slide, text, left=5.5, top=top + 0.5 + i * 0.35, width=4.0, height=0.35, font_size=14, color=color
+                    slide, text, left=left, top=top + 0.5 + i * 0.35, width=4.0, height=0.35, font_size=14, color=color
                 )
 
     def _add_table(self, slide, table: Tag, top: float):
@@ -622,7 +794,7 @@ class HTMLToPPTXConverter:
         row_height = 0.32
         for row_idx, row in enumerate(rows):
             cells = row.find_all(["th", "td"])
-            is_header = row.find("th") is not None
+            is_header = any(cell.name == "th" for cell in cells)
 
             # Calculate column widths based on content
             num_cols = len(cells)
@@ -696,11 +868,12 @@ class HTMLToPPTXConverter:
             return
 
         width_per_stat = 8.4 / num_stats
-        start_left = 0.8 + (8.4 - width_per_stat * num_stats) / 2
+        start_left = 0.8  # Stats span the full content width, so there is no centering offset
 
         for i, stat in enumerate(stats):
-            number_el = stat.find(class_="stat-number")
-            label_el = stat.find(class_="stat-label")
+            parts = find_first_by_class(stat, ("stat-number", "stat-label"))
+            number_el = parts["stat-number"]
+            label_el = parts["stat-label"]
 
             number = get_text(number_el) if number_el else ""
             label = get_text(label_el) if label_el else ""